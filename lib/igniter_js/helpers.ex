@@ -29,16 +29,18 @@ defmodule IgniterJs.Helpers do
 
   @doc """
   Read and validate the file. It returns the file content if the file exists and the
-  extension is `.js` or `.ts`, otherwise, it returns an error tuple.
+  extension is one of the allowed `extensions` (`.js` or `.ts` by default), otherwise,
+  it returns an error tuple.
 
   ```elixir
   read_and_validate_file("/path/to/file.js")
+  read_and_validate_file("/path/to/file.css", [".css"])
   ```
   """
   # sobelow_skip ["Traversal.FileModule"]
-  def read_and_validate_file(file_path) do
+  def read_and_validate_file(file_path, extensions \\ [".js", ".ts"]) do
     with true <- File.exists?(file_path),
-         true <- Path.extname(file_path) in [".js", ".ts"],
+         true <- Path.extname(file_path) in extensions,
          {:ok, file_content} <- File.read(file_path) do
       {:ok, file_content}
     else
@@ -50,22 +52,30 @@ defmodule IgniterJs.Helpers do
   @doc """
   Call the NIF function with the given file path or content and return the result.
   It helps to change the function name as atom based on its caller function.
+  With the `:path` type, the file extension is checked against `extensions`.
 
   ```elixir
   call_nif_fn("/path/to/file.js", __ENV__.function, fn content -> content end, :path)
+  call_nif_fn("/path/to/file.css", __ENV__.function, fn content -> content end, :path, [".css"])
   call_nif_fn("file content", __ENV__.function, fn content -> content end)
   call_nif_fn("file content", __ENV__.function, fn content -> content end, :content)
   ```
   """
-  def call_nif_fn(file_path, caller_function, processing_fn, type \\ :content)
+  def call_nif_fn(
+        file_path,
+        caller_function,
+        processing_fn,
+        type \\ :content,
+        extensions \\ [".js", ".ts"]
+      )
 
-  def call_nif_fn(file_content, caller_function, processing_fn, :content) do
+  def call_nif_fn(file_content, caller_function, processing_fn, :content, _extensions) do
     processing_fn.(file_content)
     |> normalize_output(caller_function)
   end
 
-  def call_nif_fn(file_path, caller_function, processing_fn, :path) do
-    case read_and_validate_file(file_path) do
+  def call_nif_fn(file_path, caller_function, processing_fn, :path, extensions) do
+    case read_and_validate_file(file_path, extensions) do
       {:ok, file_content} ->
         processing_fn.(file_content)
         |> normalize_output(caller_function)
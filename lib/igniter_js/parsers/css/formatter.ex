@@ -13,7 +13,9 @@ defmodule IgniterJs.Parsers.CSS.Formatter do
   # We set version of biemojs based on https://github.com/brioche-dev/brioche/pull/184
 
   alias IgniterJs.Native
-  import IgniterJs.Helpers, only: [call_nif_fn: 4]
+  import IgniterJs.Helpers, only: [call_nif_fn: 5]
+
+  @css_extensions [".css"]
 
   @doc """
   Checks if the provided CSS content or file is formatted.
@@ -56,10 +58,9 @@ defmodule IgniterJs.Parsers.CSS.Formatter do
     call_nif_fn(
       file_path_or_content,
       __ENV__.function,
-      fn file_content ->
-        Native.is_css_formatted_nif(file_content)
-      end,
-      type
+      &Native.is_css_formatted_nif/1,
+      type,
+      @css_extensions
     )
   end
 
@@ -67,10 +68,9 @@ defmodule IgniterJs.Parsers.CSS.Formatter do
     call_nif_fn(
       file_path_or_content,
       __ENV__.function,
-      fn file_content ->
-        Native.format_css_nif(file_content)
-      end,
-      type
+      &Native.format_css_nif/1,
+      type,
+      @css_extensions
     )
   end
 end
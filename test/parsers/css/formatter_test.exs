@@ -6,6 +6,9 @@ defmodule IgniterJSTest.Parsers.CSS.FormatterTest do
   use ExUnit.Case
   alias IgniterJs.Parsers.CSS.Formatter
 
+  @app_css "test/assets/app.css"
+  @valid_app_js "test/assets/validApp.js"
+
   test "The CSS considered is formatted :: is_formatted" do
     {:ok, _, formatted} = assert Formatter.format("body { color: red; }")
 
@@ -17,4 +20,12 @@ defmodule IgniterJSTest.Parsers.CSS.FormatterTest do
     {:ok, _, formatted} = assert Formatter.format("body { color: red; }")
     ^formatted = assert "body {\n  color: red;\n}\n"
   end
+
+  test "Format The CSS file considered:: format :path" do
+    {:ok, :format, formatted} = assert Formatter.format(@app_css, :path)
+    ^formatted = assert "body {\n  color: red;\n}\n"
+
+    {:error, :is_formatted, false} = assert Formatter.is_formatted(@app_css, :path)
+    {:error, :format, _} = assert Formatter.format(@valid_app_js, :path)
+  end
 end